@@ -19,7 +19,7 @@ class ConcoreRecipe(ConanFile):
    default_options = {"shared": False, "fPIC": True, "catch2:with_main": True}
 
    exports = "LICENSE"
-   exports_sources = ("src/*", "include/*", "CMakeLists.txt")
+   exports_sources = ("src/*", "CMakeLists.txt")
 
    def set_version(self):
       # Get the version from src/CMakeList.txt project definition